@@ -0,0 +1,169 @@
+"""Integer graph algorithms over the CSR adjacency arrays of ProjectDAG.
+
+Whole-graph passes write into ``array.array`` buffers sized once per graph.
+Point queries only allocate for the nodes they visit.
+"""
+
+from array import array
+
+
+def _zeros(n: int) -> array:
+    """Allocate a zero-filled int array of length n."""
+    return array("i", bytes(n * array("i").itemsize))
+
+
+def topological_order(in_indptr: array, out_indptr: array, out_indices: array) -> array:
+    """Return node indices in topological order using Kahn's algorithm.
+
+    Args:
+        in_indptr: CSR row pointers of the reverse (parent) adjacency
+        out_indptr: CSR row pointers of the forward (child) adjacency
+        out_indices: CSR column indices of the forward adjacency
+
+    Returns:
+        Node indices in topological order
+
+    Raises:
+        ValueError: If the graph contains a cycle
+    """
+    n = len(in_indptr) - 1
+    order = _zeros(n)
+    indegree = _zeros(n)
+    count = 0
+    for v in range(n):
+        indegree[v] = in_indptr[v + 1] - in_indptr[v]
+        if indegree[v] == 0:
+            order[count] = v
+            count += 1
+
+    head = 0
+    while head < count:
+        v = order[head]
+        head += 1
+        for k in range(out_indptr[v], out_indptr[v + 1]):
+            child = out_indices[k]
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                order[count] = child
+                count += 1
+
+    if count != n:
+        raise ValueError("Dependency graph contains a cycle")
+    return order
+
+
+def longest_paths(out_indptr: array, out_indices: array, order: array) -> array:
+    """Return the longest downstream path length (in edges) of every node.
+
+    Args:
+        out_indptr: CSR row pointers of the forward (child) adjacency
+        out_indices: CSR column indices of the forward adjacency
+        order: Node indices in topological order
+
+    Returns:
+        Longest path lengths indexed by node
+    """
+    longest = _zeros(len(order))
+    for v in reversed(order):
+        best = 0
+        for k in range(out_indptr[v], out_indptr[v + 1]):
+            length = longest[out_indices[k]] + 1
+            if length > best:
+                best = length
+        longest[v] = best
+    return longest
+
+
+def shortest_path_length(
+    source: int, target: int, out_indptr: array, out_indices: array
+) -> int:
+    """Return the shortest path length from source to target, or -1 if unreachable.
+
+    The search expands one BFS level at a time and stops as soon as the
+    target is reached, so adjacent nodes cost a single adjacency scan.
+
+    Args:
+        source: Index of the source node
+        target: Index of the target node
+        out_indptr: CSR row pointers of the forward (child) adjacency
+        out_indices: CSR column indices of the forward adjacency
+
+    Returns:
+        The number of edges on the shortest path, or -1 if there is none
+    """
+    seen = {source}
+    frontier = [source]
+    distance = 0
+    while frontier:
+        distance += 1
+        next_frontier = []
+        for v in frontier:
+            for k in range(out_indptr[v], out_indptr[v + 1]):
+                w = out_indices[k]
+                if w == target:
+                    return distance
+                if w not in seen:
+                    seen.add(w)
+                    next_frontier.append(w)
+        frontier = next_frontier
+    return -1
+
+
+def strongly_connected_components(out_indptr: array, out_indices: array) -> tuple[array, int]:
+    """Label every node with its strongly connected component (iterative Tarjan).
+
+    Args:
+        out_indptr: CSR row pointers of the forward (child) adjacency
+        out_indices: CSR column indices of the forward adjacency
+
+    Returns:
+        A tuple of (component index per node, number of components)
+    """
+    n = len(out_indptr) - 1
+    index = array("i", [-1]) * n
+    low = _zeros(n)
+    component = array("i", [-1]) * n
+    on_stack = bytearray(n)
+    stack: list[int] = []
+    counter = 0
+    n_components = 0
+
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        # Each frame is (node, position of the next child edge to visit)
+        work = [(root, out_indptr[root])]
+        while work:
+            v, k = work[-1]
+            if k < out_indptr[v + 1]:
+                work[-1] = (v, k + 1)
+                w = out_indices[k]
+                if index[w] < 0:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append((w, out_indptr[w]))
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[v] < low[parent]:
+                    low[parent] = low[v]
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    component[w] = n_components
+                    if w == v:
+                        break
+                n_components += 1
+
+    return component, n_components
@@ -0,0 +1,69 @@
+"""JSON helpers with an optional orjson fast path."""
+
+import json
+import mmap
+import os
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+# Files at least this large are parsed straight from a memory map to avoid
+# copying the whole document into a bytes object first.
+MMAP_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+
+def load_json_file(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The parsed JSON document
+
+    Raises:
+        json.JSONDecodeError: If the file is invalid JSON
+    """
+    with open(path, "rb") as f:
+        if orjson is None:
+            return json.load(f)
+
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD_BYTES:
+            return orjson.loads(f.read())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _default(obj: Any) -> Any:
+    """Convert dataclass instances for the stdlib encoder."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON, using orjson when installed.
+
+    Dataclass instances are serialized directly; orjson encodes them natively
+    without building an intermediate dictionary.
+
+    Args:
+        obj: The object to serialize
+        indent: Pretty-print with two-space indentation instead of compact output
+
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is None:
+        return json.dumps(
+            obj, indent=2 if indent else None, ensure_ascii=False, default=_default
+        ).encode("utf-8")
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
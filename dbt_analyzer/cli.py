@@ -1,5 +1,6 @@
 """Command-line interface for dbt-analyzer."""
 
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 
@@ -7,6 +8,7 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from dbt_analyzer.models import Severity
 from dbt_analyzer.project import DbtProject
 from dbt_analyzer.recommendations import generate_recommendations
 from dbt_analyzer.report import generate_json_report, generate_markdown_report
@@ -120,27 +122,25 @@ def main(
     # Generate reports
     output_path.mkdir(parents=True, exist_ok=True)
 
+    report_writers = []
     if format in ("markdown", "both"):
-        md_path = output_path / "analysis_report.md"
-        with console.status(f"[bold green]Writing Markdown report to {md_path}..."):
-            generate_markdown_report(
-                project=project,
-                findings=findings,
-                recommendations=recommendations,
-                output_path=md_path,
-            )
-        console.print(f"✓ Markdown report: [cyan]{md_path}[/cyan]")
-
+        report_writers.append(
+            ("Markdown", generate_markdown_report, output_path / "analysis_report.md")
+        )
     if format in ("json", "both"):
-        json_path = output_path / "analysis_report.json"
-        with console.status(f"[bold green]Writing JSON report to {json_path}..."):
-            generate_json_report(
+        report_writers.append(
+            ("JSON", generate_json_report, output_path / "analysis_report.json")
+        )
+
+    for label, writer, report_path in report_writers:
+        with console.status(f"[bold green]Writing {label} report to {report_path}..."):
+            writer(
                 project=project,
                 findings=findings,
                 recommendations=recommendations,
-                output_path=json_path,
+                output_path=report_path,
             )
-        console.print(f"✓ JSON report: [cyan]{json_path}[/cyan]")
+        console.print(f"✓ {label} report: [cyan]{report_path}[/cyan]")
 
     console.print("\n[bold green]✓ Analysis complete![/bold green]\n")
 
@@ -152,16 +152,12 @@ def _display_summary(findings: list, recommendations: list) -> None:
     table.add_column("Category", style="cyan", width=20)
     table.add_column("Count", justify="right", style="green")
 
-    # Count by severity
-    severity_counts = {"ERROR": 0, "WARN": 0, "INFO": 0}
-    for finding in findings:
-        sev = finding.severity.upper()
-        if sev in severity_counts:
-            severity_counts[sev] += 1
+    # Count by severity (Severity is a StrEnum, so plain strings count too)
+    severity_counts = Counter(finding.severity for finding in findings)
 
-    table.add_row("🔴 ERROR", str(severity_counts["ERROR"]))
-    table.add_row("⚠️  WARN", str(severity_counts["WARN"]))
-    table.add_row("ℹ️  INFO", str(severity_counts["INFO"]))
+    table.add_row("🔴 ERROR", str(severity_counts[Severity.ERROR]))
+    table.add_row("⚠️  WARN", str(severity_counts[Severity.WARN]))
+    table.add_row("ℹ️  INFO", str(severity_counts[Severity.INFO]))
     table.add_row("", "")
     table.add_row("💡 Recommendations", str(len(recommendations)))
 
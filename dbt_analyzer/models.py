@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-from enum import Enum
+from array import array
+from collections.abc import Iterator
+from dataclasses import InitVar, asdict, dataclass, field
+from enum import StrEnum
 from typing import Any, Optional
 
-import networkx as nx
-from pydantic import BaseModel, ConfigDict, Field
+from dbt_analyzer import _graph_kernels
 
 
-class MaterializationType(str, Enum):
+class MaterializationType(StrEnum):
     """dbt materialization types."""
 
     TABLE = "table"
@@ -20,7 +22,7 @@ class MaterializationType(str, Enum):
     SEED = "seed"
 
 
-class Severity(str, Enum):
+class Severity(StrEnum):
     """Finding severity levels."""
 
     INFO = "info"
@@ -28,7 +30,8 @@ class Severity(str, Enum):
     ERROR = "error"
 
 
-class Model(BaseModel):
+@dataclass(slots=True, eq=False)
+class Model:
     """Represents a dbt model with metadata and performance information."""
 
     name: str
@@ -37,9 +40,9 @@ class Model(BaseModel):
     path: str
     materialization: MaterializationType
     database: Optional[str] = None
-    schema_: Optional[str] = Field(None, alias="schema")
-    tags: list[str] = Field(default_factory=list)
-    meta: dict[str, Any] = Field(default_factory=dict)
+    schema_: Optional[str] = None
+    tags: list[str] = field(default_factory=list)
+    meta: dict[str, Any] = field(default_factory=dict)
 
     # Performance metrics from run_results
     execution_time: Optional[float] = None
@@ -47,14 +50,20 @@ class Model(BaseModel):
     status: Optional[str] = None
 
     # DAG relationships (populated after graph construction)
-    upstream_models: list[str] = Field(default_factory=list)
-    downstream_models: list[str] = Field(default_factory=list)
+    upstream_models: list[str] = field(default_factory=list)
+    downstream_models: list[str] = field(default_factory=list)
 
-    # Compiled SQL (optional, from manifest)
-    compiled_sql: Optional[str] = None
-    raw_sql: Optional[str] = None
+    # SQL is not kept on models; use DbtProject.get_model_sql() when needed
 
-    model_config = ConfigDict(populate_by_name=True, use_enum_values=True)
+    # Accepts the manifest's key name, like the schema_ alias before dataclasses
+    schema: InitVar[Optional[str]] = None
+
+    def __post_init__(self, schema: Optional[str]) -> None:
+        """Apply the schema alias and coerce string materializations to members."""
+        if schema is not None:
+            self.schema_ = schema
+        if type(self.materialization) is not MaterializationType:
+            self.materialization = MaterializationType(self.materialization)
 
     def __hash__(self) -> int:
         """Make Model hashable for use in sets and as dict keys."""
@@ -66,8 +75,13 @@ class Model(BaseModel):
             return NotImplemented
         return self.unique_id == other.unique_id
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the model to a plain dictionary."""
+        return asdict(self)
+
 
-class Finding(BaseModel):
+@dataclass(slots=True)
+class Finding:
     """Represents a single analysis finding/issue."""
 
     id: str
@@ -78,12 +92,15 @@ class Finding(BaseModel):
     rationale: str
     suggested_action: str
     proposed_changes: Optional[dict[str, Any]] = None
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
 
-    model_config = ConfigDict(use_enum_values=True)
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the finding to a plain dictionary."""
+        return asdict(self)
 
 
-class Recommendation(BaseModel):
+@dataclass(slots=True)
+class Recommendation:
     """High-level recommendation aggregating multiple findings."""
 
     id: str
@@ -91,20 +108,268 @@ class Recommendation(BaseModel):
     description: str
     impact: str
     effort: str
-    findings: list[Finding] = Field(default_factory=list)
-    code_snippets: list[str] = Field(default_factory=list)
+    findings: list[Finding] = field(default_factory=list)
+    code_snippets: list[str] = field(default_factory=list)
     priority: int = 1
 
-    model_config = ConfigDict(use_enum_values=True)
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the recommendation (and its findings) to a plain dictionary."""
+        return asdict(self)
+
+
+def _to_csr(rows: list[list[int]]) -> tuple[array, array]:
+    """Compress per-node neighbor lists into CSR (indptr, indices) arrays.
+
+    Duplicate neighbors are dropped while preserving insertion order.
+    """
+    indptr = array("i", [0])
+    indices = array("i")
+    for row in rows:
+        indices.extend(dict.fromkeys(row))
+        indptr.append(len(indices))
+    return indptr, indices
+
+
+def _farthest_distance(start: int, indptr: array, indices: array) -> int:
+    """Return the BFS distance from a start node to its farthest reachable node."""
+    seen = {start}
+    depth = 0
+    frontier = [start]
+    while True:
+        next_frontier = []
+        for v in frontier:
+            for w in indices[indptr[v]:indptr[v + 1]]:
+                if w not in seen:
+                    seen.add(w)
+                    next_frontier.append(w)
+        if not next_frontier:
+            return depth
+        depth += 1
+        frontier = next_frontier
 
 
 class ProjectDAG:
-    """Represents the dbt project as a directed acyclic graph."""
+    """Represents the dbt project as a directed acyclic graph.
+
+    Every node is assigned an integer index in insertion order. Edges are
+    compiled on first query into compressed sparse row (CSR) arrays for both
+    directions, so traversals walk flat integer arrays instead of nested dicts.
+    """
 
     def __init__(self) -> None:
         """Initialize an empty project DAG."""
-        self.graph: nx.DiGraph = nx.DiGraph()
         self.models: dict[str, Model] = {}
+        # Model name -> unique_id; the first model added wins on duplicate names
+        self.name_index: dict[str, str] = {}
+        self.id_to_idx: dict[str, int] = {}
+        self.idx_to_id: list[str] = []
+
+        # Edge list in insertion order, compiled to CSR arrays by _ensure_csr()
+        self._edge_src = array("i")
+        self._edge_dst = array("i")
+        self._csr_valid = False
+        self._out_indptr = array("i", [0])
+        self._out_indices = array("i")
+        self._in_indptr = array("i", [0])
+        self._in_indices = array("i")
+        self._topo_order: Optional[array] = None
+
+        # Per-node analytics filled by compute_analytics(), indexed like idx_to_id
+        self._analytics_valid = False
+        # Reachability bitsets: bit u of _descendant_bits[v] is set iff u is
+        # reachable from v (and likewise upstream for _ancestor_bits)
+        self._longest_down = array("i")
+        self._descendant_bits: list[int] = []
+        self._ancestor_bits: list[int] = []
+
+    def _node_index(self, unique_id: str) -> int:
+        """Return the integer index of a node, assigning one if needed."""
+        idx = self.id_to_idx.get(unique_id)
+        if idx is None:
+            idx = len(self.idx_to_id)
+            self.id_to_idx[unique_id] = idx
+            self.idx_to_id.append(unique_id)
+            self._csr_valid = False
+        return idx
+
+    def _ensure_csr(self) -> None:
+        """Compile the edge list into CSR arrays if the graph has changed."""
+        if self._csr_valid:
+            return
+
+        n = len(self.idx_to_id)
+        children: list[list[int]] = [[] for _ in range(n)]
+        parents: list[list[int]] = [[] for _ in range(n)]
+        for src, dst in zip(self._edge_src, self._edge_dst):
+            children[src].append(dst)
+            parents[dst].append(src)
+
+        self._out_indptr, self._out_indices = _to_csr(children)
+        self._in_indptr, self._in_indices = _to_csr(parents)
+        self._topo_order = None
+        self._analytics_valid = False
+        self._csr_valid = True
+
+    def _topological_order(self) -> array:
+        """Return node indices in topological order (Kahn's algorithm).
+
+        Raises:
+            ValueError: If the graph contains a cycle
+        """
+        self._ensure_csr()
+        if self._topo_order is None:
+            self._topo_order = _graph_kernels.topological_order(
+                self._in_indptr, self._out_indptr, self._out_indices
+            )
+        return self._topo_order
+
+    def _ensure_analytics(self) -> None:
+        """Recompute per-node analytics if the graph has changed."""
+        self._ensure_csr()
+        if not self._analytics_valid:
+            self.compute_analytics()
+
+    def prepare_for_queries(self) -> None:
+        """Build any stale CSR arrays and analytics up front.
+
+        Queries build these lazily on first use. Calling this first means the
+        queries that follow only read the DAG, so they can run concurrently.
+        """
+        self._ensure_analytics()
+
+    def compute_analytics(self) -> None:
+        """Precompute transitive closures and longest paths for every node.
+
+        A single pass over the topological order fills the ancestor and
+        descendant bitsets (one bit per node index) and the longest downstream
+        path of every node, so the transitive queries become lookups instead of
+        per-node traversals. This runs automatically on the first query after
+        the graph changes.
+
+        If the graph contains a cycle there is no topological order, so the
+        analytics are computed on its strongly connected components instead
+        (see _compute_condensed_analytics()).
+        """
+        try:
+            order = self._topological_order()
+        except ValueError:
+            self._compute_condensed_analytics()
+            return
+
+        out_indptr, out_indices = self._out_indptr, self._out_indices
+        in_indptr, in_indices = self._in_indptr, self._in_indices
+        n = len(self.idx_to_id)
+
+        longest_down = _graph_kernels.longest_paths(out_indptr, out_indices, order)
+
+        descendant_bits = [0] * n
+        for v in reversed(order):
+            children = out_indices[out_indptr[v]:out_indptr[v + 1]]
+            if not children:
+                continue
+            bits = 0
+            for c in children:
+                bits |= (1 << c) | descendant_bits[c]
+            descendant_bits[v] = bits
+
+        ancestor_bits = [0] * n
+        for v in order:
+            bits = 0
+            for p in in_indices[in_indptr[v]:in_indptr[v + 1]]:
+                bits |= (1 << p) | ancestor_bits[p]
+            ancestor_bits[v] = bits
+
+        self._longest_down = longest_down
+        self._descendant_bits = descendant_bits
+        self._ancestor_bits = ancestor_bits
+        self._analytics_valid = True
+
+    def _compute_condensed_analytics(self) -> None:
+        """Fill the per-node analytics for a graph that contains cycles.
+
+        Every strongly connected component is collapsed into a single node,
+        and the same topological passes as compute_analytics() run on the
+        resulting acyclic graph. Models outside a cycle therefore keep their
+        usual metrics, with a downstream cycle counting as one step. Only
+        models inside a cycle fall back to a breadth-first search, and their
+        "longest path" is the distance to their farthest descendant.
+        """
+        out_indptr, out_indices = self._out_indptr, self._out_indices
+        n = len(self.idx_to_id)
+        component, n_components = _graph_kernels.strongly_connected_components(
+            out_indptr, out_indices
+        )
+
+        member_bits = [0] * n_components
+        cyclic = bytearray(n_components)
+        comp_children: list[list[int]] = [[] for _ in range(n_components)]
+        comp_parents: list[list[int]] = [[] for _ in range(n_components)]
+        for v in range(n):
+            cv = component[v]
+            if member_bits[cv]:
+                cyclic[cv] = 1
+            member_bits[cv] |= 1 << v
+            for w in out_indices[out_indptr[v]:out_indptr[v + 1]]:
+                cw = component[w]
+                if cw == cv:
+                    cyclic[cv] = 1
+                else:
+                    comp_children[cv].append(cw)
+                    comp_parents[cw].append(cv)
+
+        comp_out_indptr, comp_out_indices = _to_csr(comp_children)
+        comp_in_indptr, comp_in_indices = _to_csr(comp_parents)
+        order = _graph_kernels.topological_order(
+            comp_in_indptr, comp_out_indptr, comp_out_indices
+        )
+        comp_longest = _graph_kernels.longest_paths(comp_out_indptr, comp_out_indices, order)
+
+        comp_descendants = [0] * n_components
+        for c in reversed(order):
+            bits = 0
+            for d in comp_out_indices[comp_out_indptr[c]:comp_out_indptr[c + 1]]:
+                bits |= member_bits[d] | comp_descendants[d]
+            comp_descendants[c] = bits
+
+        comp_ancestors = [0] * n_components
+        for c in order:
+            bits = 0
+            for p in comp_in_indices[comp_in_indptr[c]:comp_in_indptr[c + 1]]:
+                bits |= member_bits[p] | comp_ancestors[p]
+            comp_ancestors[c] = bits
+
+        longest_down = array("i", bytes(n * array("i").itemsize))
+        descendant_bits = [0] * n
+        ancestor_bits = [0] * n
+        for v in range(n):
+            c = component[v]
+            if cyclic[c]:
+                # The rest of the cycle is both upstream and downstream of v
+                others = member_bits[c] & ~(1 << v)
+                descendant_bits[v] = comp_descendants[c] | others
+                ancestor_bits[v] = comp_ancestors[c] | others
+                longest_down[v] = _farthest_distance(v, out_indptr, out_indices)
+            else:
+                descendant_bits[v] = comp_descendants[c]
+                ancestor_bits[v] = comp_ancestors[c]
+                longest_down[v] = comp_longest[c]
+
+        self._longest_down = longest_down
+        self._descendant_bits = descendant_bits
+        self._ancestor_bits = ancestor_bits
+        self._analytics_valid = True
+
+    def _ids_from_bits(self, bits: int) -> set[str]:
+        """Convert a reachability bitset into a set of unique_ids."""
+        idx_to_id = self.idx_to_id
+        # Reverse the binary digits so string positions match bit indices
+        digits = format(bits, "b")[::-1]
+        ids: set[str] = set()
+        i = digits.find("1")
+        while i >= 0:
+            ids.add(idx_to_id[i])
+            i = digits.find("1", i + 1)
+        return ids
 
     def add_model(self, model: Model) -> None:
         """Add a model to the DAG.
@@ -113,7 +378,8 @@ class ProjectDAG:
             model: The model to add
         """
         self.models[model.unique_id] = model
-        self.graph.add_node(model.unique_id, model=model)
+        self.name_index.setdefault(model.name, model.unique_id)
+        self._node_index(model.unique_id)
 
     def add_dependency(self, parent_id: str, child_id: str) -> None:
         """Add a dependency edge from parent to child.
@@ -122,7 +388,9 @@ class ProjectDAG:
             parent_id: The unique_id of the parent (upstream) model
             child_id: The unique_id of the child (downstream) model
         """
-        self.graph.add_edge(parent_id, child_id)
+        self._edge_src.append(self._node_index(parent_id))
+        self._edge_dst.append(self._node_index(child_id))
+        self._csr_valid = False
 
     def get_model(self, unique_id: str) -> Optional[Model]:
         """Get a model by its unique_id.
@@ -144,9 +412,13 @@ class ProjectDAG:
         Returns:
             List of upstream model unique_ids
         """
-        if unique_id not in self.graph:
+        idx = self.id_to_idx.get(unique_id)
+        if idx is None:
             return []
-        return list(self.graph.predecessors(unique_id))
+        self._ensure_csr()
+        idx_to_id = self.idx_to_id
+        start, end = self._in_indptr[idx], self._in_indptr[idx + 1]
+        return [idx_to_id[i] for i in self._in_indices[start:end]]
 
     def get_downstream(self, unique_id: str) -> list[str]:
         """Get all downstream (child) model IDs for a given model.
@@ -157,9 +429,75 @@ class ProjectDAG:
         Returns:
             List of downstream model unique_ids
         """
-        if unique_id not in self.graph:
+        idx = self.id_to_idx.get(unique_id)
+        if idx is None:
             return []
-        return list(self.graph.successors(unique_id))
+        self._ensure_csr()
+        idx_to_id = self.idx_to_id
+        start, end = self._out_indptr[idx], self._out_indptr[idx + 1]
+        return [idx_to_id[i] for i in self._out_indices[start:end]]
+
+    def get_upstream_iter(self, unique_id: str) -> Iterator[str]:
+        """Iterate upstream (parent) model IDs without building a list.
+
+        Args:
+            unique_id: The unique_id of the model
+
+        Returns:
+            Iterator over upstream model unique_ids
+        """
+        idx = self.id_to_idx.get(unique_id)
+        if idx is None:
+            return iter(())
+        self._ensure_csr()
+        start, end = self._in_indptr[idx], self._in_indptr[idx + 1]
+        return map(self.idx_to_id.__getitem__, self._in_indices[start:end])
+
+    def get_downstream_iter(self, unique_id: str) -> Iterator[str]:
+        """Iterate downstream (child) model IDs without building a list.
+
+        Args:
+            unique_id: The unique_id of the model
+
+        Returns:
+            Iterator over downstream model unique_ids
+        """
+        idx = self.id_to_idx.get(unique_id)
+        if idx is None:
+            return iter(())
+        self._ensure_csr()
+        start, end = self._out_indptr[idx], self._out_indptr[idx + 1]
+        return map(self.idx_to_id.__getitem__, self._out_indices[start:end])
+
+    def upstream_count(self, unique_id: str) -> int:
+        """Count direct upstream (parent) models in O(1).
+
+        Args:
+            unique_id: The unique_id of the model
+
+        Returns:
+            Number of direct upstream models
+        """
+        idx = self.id_to_idx.get(unique_id)
+        if idx is None:
+            return 0
+        self._ensure_csr()
+        return self._in_indptr[idx + 1] - self._in_indptr[idx]
+
+    def downstream_count(self, unique_id: str) -> int:
+        """Count direct downstream (child) models in O(1).
+
+        Args:
+            unique_id: The unique_id of the model
+
+        Returns:
+            Number of direct downstream models
+        """
+        idx = self.id_to_idx.get(unique_id)
+        if idx is None:
+            return 0
+        self._ensure_csr()
+        return self._out_indptr[idx + 1] - self._out_indptr[idx]
 
     def get_all_upstream(self, unique_id: str) -> set[str]:
         """Get all transitive upstream dependencies for a model.
@@ -170,9 +508,11 @@ class ProjectDAG:
         Returns:
             Set of all upstream model unique_ids (transitive closure)
         """
-        if unique_id not in self.graph:
+        idx = self.id_to_idx.get(unique_id)
+        if idx is None:
             return set()
-        return nx.ancestors(self.graph, unique_id)
+        self._ensure_analytics()
+        return self._ids_from_bits(self._ancestor_bits[idx])
 
     def get_all_downstream(self, unique_id: str) -> set[str]:
         """Get all transitive downstream dependents for a model.
@@ -183,9 +523,41 @@ class ProjectDAG:
         Returns:
             Set of all downstream model unique_ids (transitive closure)
         """
-        if unique_id not in self.graph:
+        idx = self.id_to_idx.get(unique_id)
+        if idx is None:
             return set()
-        return nx.descendants(self.graph, unique_id)
+        self._ensure_analytics()
+        return self._ids_from_bits(self._descendant_bits[idx])
+
+    def count_all_upstream(self, unique_id: str) -> int:
+        """Count transitive upstream dependencies without materializing them.
+
+        Args:
+            unique_id: The unique_id of the model
+
+        Returns:
+            Number of models in the transitive upstream closure
+        """
+        idx = self.id_to_idx.get(unique_id)
+        if idx is None:
+            return 0
+        self._ensure_analytics()
+        return self._ancestor_bits[idx].bit_count()
+
+    def count_all_downstream(self, unique_id: str) -> int:
+        """Count transitive downstream dependents without materializing them.
+
+        Args:
+            unique_id: The unique_id of the model
+
+        Returns:
+            Number of models in the transitive downstream closure
+        """
+        idx = self.id_to_idx.get(unique_id)
+        if idx is None:
+            return 0
+        self._ensure_analytics()
+        return self._descendant_bits[idx].bit_count()
 
     def get_path_length(self, source_id: str, target_id: str) -> Optional[int]:
         """Get the shortest path length between two models.
@@ -197,10 +569,18 @@ class ProjectDAG:
         Returns:
             The path length if a path exists, None otherwise
         """
-        try:
-            return nx.shortest_path_length(self.graph, source_id, target_id)
-        except (nx.NetworkXNoPath, nx.NodeNotFound):
+        source = self.id_to_idx.get(source_id)
+        target = self.id_to_idx.get(target_id)
+        if source is None or target is None:
             return None
+        if source == target:
+            return 0
+
+        self._ensure_csr()
+        length = _graph_kernels.shortest_path_length(
+            source, target, self._out_indptr, self._out_indices
+        )
+        return length if length >= 0 else None
 
     def get_longest_path_from(self, unique_id: str) -> int:
         """Get the length of the longest path from a model to any leaf.
@@ -211,22 +591,12 @@ class ProjectDAG:
         Returns:
             The length of the longest path
         """
-        if unique_id not in self.graph:
+        idx = self.id_to_idx.get(unique_id)
+        if idx is None:
             return 0
 
-        descendants = self.get_all_downstream(unique_id)
-        if not descendants:
-            return 0
-
-        max_length = 0
-        for desc in descendants:
-            try:
-                path_len = nx.shortest_path_length(self.graph, unique_id, desc)
-                max_length = max(max_length, path_len)
-            except (nx.NetworkXNoPath, nx.NodeNotFound):
-                continue
-
-        return max_length
+        self._ensure_analytics()
+        return self._longest_down[idx]
 
     def populate_model_relationships(self) -> None:
         """Populate upstream/downstream relationships in all models."""
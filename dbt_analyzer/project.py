@@ -1,11 +1,26 @@
 """Project loading and manifest parsing for dbt projects."""
 
-import json
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from sys import intern
 from typing import Any, Optional
 
+from dbt_analyzer._json import load_json_file
 from dbt_analyzer.models import MaterializationType, Model, ProjectDAG
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on installed extras
+    ijson = None
+
+# Manifest materialization value -> enum member, avoiding Enum lookup per node
+_MATERIALIZATIONS = {m.value: m for m in MaterializationType}
+
+
+def _intern_optional(value: Optional[str]) -> Optional[str]:
+    """Intern a string value, passing None through."""
+    return None if value is None else intern(value)
+
 
 def parse_model_from_node(node_id: str, node: dict[str, Any]) -> Model:
     """Parse a dbt manifest node into a Model object.
@@ -21,25 +36,21 @@ def parse_model_from_node(node_id: str, node: dict[str, Any]) -> Model:
     config = node.get("config", {})
     materialized = config.get("materialized", "view")
 
-    # Map to our MaterializationType enum
-    try:
-        materialization = MaterializationType(materialized)
-    except ValueError:
-        # Default to VIEW if unknown materialization
-        materialization = MaterializationType.VIEW
+    # Map to our MaterializationType enum, defaulting to VIEW if unknown
+    materialization = _MATERIALIZATIONS.get(materialized, MaterializationType.VIEW)
 
+    # Identifiers and categorical fields repeat across thousands of nodes and
+    # key the DAG dicts, so share a single interned copy of each
     return Model(
-        name=node.get("name", ""),
-        unique_id=node_id,
-        resource_type=node.get("resource_type", "model"),
+        name=intern(node.get("name", "")),
+        unique_id=intern(node_id),
+        resource_type=intern(node.get("resource_type", "model")),
         path=node.get("path", ""),
         materialization=materialization,
-        database=node.get("database"),
-        schema=node.get("schema"),
-        tags=node.get("tags", []),
+        database=_intern_optional(node.get("database")),
+        schema_=_intern_optional(node.get("schema")),
+        tags=[intern(tag) for tag in node.get("tags", ())],
         meta=node.get("meta", {}),
-        compiled_sql=node.get("compiled_sql"),
-        raw_sql=node.get("raw_sql"),
     )
 
 
@@ -59,8 +70,77 @@ def load_manifest(manifest_path: Path) -> dict[str, Any]:
     if not manifest_path.exists():
         raise FileNotFoundError(f"Manifest not found at {manifest_path}")
 
-    with open(manifest_path) as f:
-        return json.load(f)
+    return load_json_file(manifest_path)
+
+
+def read_manifest(
+    manifest_path: Path,
+) -> tuple[dict[str, Any], Iterator[tuple[str, dict[str, Any]]]]:
+    """Read manifest metadata and stream its model nodes.
+
+    When ijson is installed, nodes are parsed one at a time so the full
+    manifest (sources, macros, docs, ...) is never held in memory. Otherwise
+    the manifest is loaded once and its model nodes are iterated.
+
+    Args:
+        manifest_path: Path to the manifest.json file
+
+    Returns:
+        A tuple of (metadata, iterator of (unique_id, node) for model nodes)
+
+    Raises:
+        FileNotFoundError: If the manifest file doesn't exist
+    """
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"Manifest not found at {manifest_path}")
+
+    if ijson is None:
+        manifest = load_manifest(manifest_path)
+        nodes = manifest.get("nodes", {})
+        model_nodes = (
+            (node_id, node)
+            for node_id, node in nodes.items()
+            if node.get("resource_type") == "model"
+        )
+        return manifest.get("metadata", {}), model_nodes
+
+    # dbt writes metadata first, so this stops after the first few bytes
+    with open(manifest_path, "rb") as f:
+        metadata = next(ijson.items(f, "metadata", use_float=True), {})
+
+    return metadata, _stream_model_nodes(manifest_path)
+
+
+def load_manifest_node(manifest_path: Path, unique_id: str) -> Optional[dict[str, Any]]:
+    """Load a single node from a manifest without keeping the rest of it.
+
+    Args:
+        manifest_path: Path to the manifest.json file
+        unique_id: The unique_id of the node
+
+    Returns:
+        The node dictionary if found, None otherwise
+
+    Raises:
+        FileNotFoundError: If the manifest file doesn't exist
+    """
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"Manifest not found at {manifest_path}")
+
+    if ijson is None:
+        return load_manifest(manifest_path).get("nodes", {}).get(unique_id)
+
+    # ijson only builds the object at this prefix; everything else is skipped
+    with open(manifest_path, "rb") as f:
+        return next(ijson.items(f, f"nodes.{unique_id}", use_float=True), None)
+
+
+def _stream_model_nodes(manifest_path: Path) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield (unique_id, node) pairs for model nodes using ijson."""
+    with open(manifest_path, "rb") as f:
+        for node_id, node in ijson.kvitems(f, "nodes", use_float=True):
+            if node.get("resource_type") == "model":
+                yield node_id, node
 
 
 class DbtProject:
@@ -82,6 +162,7 @@ class DbtProject:
         self.project_path = project_path
         self.manifest_path = manifest_path or (project_path / "manifest.json")
         self.run_results_path = run_results_path
+        # Slim projection of the manifest (metadata only); nodes are streamed
         self.manifest: Optional[dict[str, Any]] = None
         self.dag: Optional[ProjectDAG] = None
 
@@ -93,51 +174,67 @@ class DbtProject:
         """
         from dbt_analyzer.results import load_run_results, merge_run_results_into_dag
 
-        self.manifest = load_manifest(self.manifest_path)
-        self.dag = self._build_dag()
+        metadata, model_nodes = read_manifest(self.manifest_path)
+        self.manifest = {"metadata": metadata}
+        self.dag = self._build_dag(model_nodes)
 
         # Load run results if path is provided
         if self.run_results_path and self.run_results_path.exists():
             run_results = load_run_results(self.run_results_path)
             merge_run_results_into_dag(self.dag, run_results)
 
-    def _build_dag(self) -> ProjectDAG:
-        """Build the project DAG from the loaded manifest.
+    def _build_dag(self, model_nodes: Iterable[tuple[str, dict[str, Any]]]) -> ProjectDAG:
+        """Build the project DAG from manifest model nodes in a single pass.
+
+        Args:
+            model_nodes: Iterable of (unique_id, node) pairs for model nodes
 
         Returns:
             A ProjectDAG object with models and relationships
-
-        Raises:
-            ValueError: If manifest is not loaded
         """
-        if self.manifest is None:
-            raise ValueError("Manifest not loaded. Call load() first.")
-
         dag = ProjectDAG()
+        add_model = dag.add_model
+        edges: list[tuple[str, str]] = []
+
+        for node_id, node in model_nodes:
+            add_model(parse_model_from_node(node_id, node))
+            for parent_id in node.get("depends_on", {}).get("nodes", ()):
+                edges.append((parent_id, node_id))
+
+        # Parents may appear later in the manifest, so edges are filtered once
+        # every model is known. Only edges between loaded models are kept, which
+        # drops sources, seeds and references to disabled models alike.
+        models = dag.models
+        add_dependency = dag.add_dependency
+        for parent_id, child_id in edges:
+            if parent_id in models:
+                add_dependency(parent_id, child_id)
+
+        # Populate model relationships; transitive analytics are computed
+        # lazily on the first query
+        dag.populate_model_relationships()
 
-        # First pass: add all model nodes
-        nodes = self.manifest.get("nodes", {})
-        for node_id, node in nodes.items():
-            # Only process model nodes (skip tests, snapshots, etc.)
-            if node.get("resource_type") == "model":
-                model = parse_model_from_node(node_id, node)
-                dag.add_model(model)
+        return dag
 
-        # Second pass: add dependencies
-        for node_id, node in nodes.items():
-            if node.get("resource_type") == "model":
-                depends_on = node.get("depends_on", {})
-                parent_nodes = depends_on.get("nodes", [])
+    def get_model_sql(self, unique_id: str) -> tuple[Optional[str], Optional[str]]:
+        """Read a model's compiled and raw SQL from the manifest on demand.
 
-                for parent_id in parent_nodes:
-                    # Only add edges between models (not sources)
-                    if parent_id.startswith("model."):
-                        dag.add_dependency(parent_id, node_id)
+        SQL is the bulkiest part of a manifest node and only a few consumers
+        need it, so it is not kept on Model objects.
 
-        # Populate model relationships
-        dag.populate_model_relationships()
+        Args:
+            unique_id: The unique_id of the model
 
-        return dag
+        Returns:
+            A (compiled_sql, raw_sql) tuple; either is None if unavailable
+
+        Raises:
+            FileNotFoundError: If the manifest file doesn't exist
+        """
+        node = load_manifest_node(self.manifest_path, unique_id)
+        if node is None:
+            return None, None
+        return node.get("compiled_sql"), node.get("raw_sql")
 
     def get_models(self) -> list[Model]:
         """Get all models in the project.
@@ -168,7 +265,4 @@ class DbtProject:
         if self.dag is None:
             raise ValueError("DAG not loaded. Call load() first.")
 
-        for model in self.dag.models.values():
-            if model.name == name:
-                return model
-        return None
+        return self.dag.models.get(self.dag.name_index.get(name))
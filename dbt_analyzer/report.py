@@ -1,13 +1,66 @@
 """Report generation for dbt analysis."""
 
-import json
+import heapq
+import io
+from collections import Counter
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
+from dbt_analyzer._json import dumps
 from dbt_analyzer.models import Finding, Recommendation, Severity
 from dbt_analyzer.project import DbtProject
 
+# Write buffer for the JSON report; the many small per-item writes are
+# coalesced into a handful of syscalls instead of one per 8 KiB default block.
+JSON_WRITE_BUFFER_BYTES = 1024 * 1024
+
+# The Markdown report is encoded and written in chunks of this many characters
+# through a buffer of the same size, so the whole report is never held twice.
+MARKDOWN_WRITE_CHUNK_SIZE = 128 * 1024
+
+_FINDING_TEMPLATE = (
+    "#### {f.title}\n"
+    "\n"
+    "**Model:** `{f.model_name}`\n"
+    "\n"
+    "**Description:** {f.description}\n"
+    "\n"
+    "**Suggested Action:** {f.suggested_action}\n"
+    "\n"
+)
+
+# INFO findings are informational, so the report omits their suggested action
+_INFO_FINDING_TEMPLATE = (
+    "#### {f.title}\n"
+    "\n"
+    "**Model:** `{f.model_name}`\n"
+    "\n"
+    "**Description:** {f.description}\n"
+    "\n"
+)
+
+# (severity, section header, finding formatter) in report order
+_SEVERITY_SECTIONS = (
+    (Severity.ERROR, "### 🔴 ERROR\n\n", _FINDING_TEMPLATE.format),
+    (Severity.WARN, "### ⚠️  WARN\n\n", _FINDING_TEMPLATE.format),
+    (Severity.INFO, "### ℹ️  INFO\n\n", _INFO_FINDING_TEMPLATE.format),
+)
+
+
+def _open_for_write(output_path: Path, buffering: int = -1) -> BinaryIO:
+    """Open a report file for binary writing, creating its directory if needed.
+
+    The directory is only created when the first open fails, so writing into
+    an existing directory (the CLI creates it up front) costs no extra syscalls.
+    """
+    try:
+        return open(output_path, "wb", buffering=buffering)
+    except FileNotFoundError:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        return open(output_path, "wb", buffering=buffering)
+
 
 def generate_markdown_report(
     project: DbtProject,
@@ -23,166 +76,117 @@ def generate_markdown_report(
         recommendations: List of recommendations
         output_path: Path to write the report
     """
-    lines: list[str] = []
+    buf = io.StringIO()
+    write = buf.write
 
     # Header
-    lines.append("# dbt Pipeline Analysis Report")
-    lines.append("")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"**Project:** `{project.project_path}`")
-    lines.append("")
+    write(
+        "# dbt Pipeline Analysis Report\n"
+        "\n"
+        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"**Project:** `{project.project_path}`\n"
+        "\n"
+    )
 
     # Summary
-    lines.append("## Summary")
-    lines.append("")
-
     total_models = len(project.dag.models) if project.dag else 0
-    lines.append(f"- **Total Models:** {total_models}")
-    lines.append(f"- **Total Findings:** {len(findings)}")
-    lines.append(f"- **Total Recommendations:** {len(recommendations)}")
-    lines.append("")
-
-    # Count findings by severity
-    severity_counts = {
-        Severity.ERROR: 0,
-        Severity.WARN: 0,
-        Severity.INFO: 0,
+    write(
+        "## Summary\n"
+        "\n"
+        f"- **Total Models:** {total_models}\n"
+        f"- **Total Findings:** {len(findings)}\n"
+        f"- **Total Recommendations:** {len(recommendations)}\n"
+        "\n"
+    )
+
+    # Group findings by severity; the counts are the bucket sizes
+    findings_by_severity: dict[Severity, list[Finding]] = {
+        Severity.ERROR: [],
+        Severity.WARN: [],
+        Severity.INFO: [],
     }
     for finding in findings:
-        severity_counts[finding.severity] += 1
+        findings_by_severity[finding.severity].append(finding)
 
-    lines.append("**Findings by Severity:**")
-    lines.append(f"- 🔴 ERROR: {severity_counts[Severity.ERROR]}")
-    lines.append(f"- ⚠️  WARN: {severity_counts[Severity.WARN]}")
-    lines.append(f"- ℹ️  INFO: {severity_counts[Severity.INFO]}")
-    lines.append("")
+    write(
+        "**Findings by Severity:**\n"
+        f"- 🔴 ERROR: {len(findings_by_severity[Severity.ERROR])}\n"
+        f"- ⚠️  WARN: {len(findings_by_severity[Severity.WARN])}\n"
+        f"- ℹ️  INFO: {len(findings_by_severity[Severity.INFO])}\n"
+        "\n"
+    )
 
     # Recommendations
+    write("## Recommendations\n\n")
     if recommendations:
-        lines.append("## Recommendations")
-        lines.append("")
-
         for i, rec in enumerate(recommendations, 1):
-            lines.append(f"### {i}. {rec.title}")
-            lines.append("")
-            lines.append(f"**Priority:** {rec.priority}")
-            lines.append("")
-            lines.append(f"**Impact:** {rec.impact}")
-            lines.append("")
-            lines.append(f"**Effort:** {rec.effort}")
-            lines.append("")
-            lines.append(f"**Description:**")
-            lines.append("")
-            lines.append(rec.description)
-            lines.append("")
+            write(
+                f"### {i}. {rec.title}\n"
+                "\n"
+                f"**Priority:** {rec.priority}\n"
+                "\n"
+                f"**Impact:** {rec.impact}\n"
+                "\n"
+                f"**Effort:** {rec.effort}\n"
+                "\n"
+                "**Description:**\n"
+                "\n"
+                f"{rec.description}\n"
+                "\n"
+            )
 
             if rec.code_snippets:
-                lines.append("**Code Examples:**")
-                lines.append("")
+                write("**Code Examples:**\n\n")
                 for snippet in rec.code_snippets:
-                    lines.append("```sql")
-                    lines.append(snippet)
-                    lines.append("```")
-                    lines.append("")
+                    write(f"```sql\n{snippet}\n```\n\n")
 
-            lines.append(f"*Affects {len(rec.findings)} model(s)*")
-            lines.append("")
+            write(f"*Affects {len(rec.findings)} model(s)*\n\n")
     else:
-        lines.append("## Recommendations")
-        lines.append("")
-        lines.append("✅ No recommendations - your dbt project looks good!")
-        lines.append("")
+        write("✅ No recommendations - your dbt project looks good!\n\n")
 
     # Findings by Severity
-    lines.append("## Findings by Severity")
-    lines.append("")
+    write("## Findings by Severity\n\n")
 
     if findings:
-        # Group findings by severity
-        findings_by_severity: dict[Severity, list[Finding]] = {
-            Severity.ERROR: [],
-            Severity.WARN: [],
-            Severity.INFO: [],
-        }
-        for finding in findings:
-            findings_by_severity[finding.severity].append(finding)
-
-        # ERROR findings
-        if findings_by_severity[Severity.ERROR]:
-            lines.append("### 🔴 ERROR")
-            lines.append("")
-            for finding in findings_by_severity[Severity.ERROR]:
-                lines.append(f"#### {finding.title}")
-                lines.append("")
-                lines.append(f"**Model:** `{finding.model_name}`")
-                lines.append("")
-                lines.append(f"**Description:** {finding.description}")
-                lines.append("")
-                lines.append(f"**Suggested Action:** {finding.suggested_action}")
-                lines.append("")
-
-        # WARN findings
-        if findings_by_severity[Severity.WARN]:
-            lines.append("### ⚠️  WARN")
-            lines.append("")
-            for finding in findings_by_severity[Severity.WARN]:
-                lines.append(f"#### {finding.title}")
-                lines.append("")
-                lines.append(f"**Model:** `{finding.model_name}`")
-                lines.append("")
-                lines.append(f"**Description:** {finding.description}")
-                lines.append("")
-                lines.append(f"**Suggested Action:** {finding.suggested_action}")
-                lines.append("")
-
-        # INFO findings
-        if findings_by_severity[Severity.INFO]:
-            lines.append("### ℹ️  INFO")
-            lines.append("")
-            for finding in findings_by_severity[Severity.INFO]:
-                lines.append(f"#### {finding.title}")
-                lines.append("")
-                lines.append(f"**Model:** `{finding.model_name}`")
-                lines.append("")
-                lines.append(f"**Description:** {finding.description}")
-                lines.append("")
+        for severity, header, format_finding in _SEVERITY_SECTIONS:
+            group = findings_by_severity[severity]
+            if group:
+                write(header)
+                write("".join(format_finding(f=finding) for finding in group))
     else:
-        lines.append("✅ No findings - your dbt project looks good!")
-        lines.append("")
+        write("✅ No findings - your dbt project looks good!\n\n")
 
     # Model Performance (if run_results available)
     if project.dag:
-        models_with_perf = [
-            m for m in project.dag.models.values()
-            if m.execution_time is not None
-        ]
-
-        if models_with_perf:
-            lines.append("## Top Models by Execution Time")
-            lines.append("")
+        # Select the slowest models without collecting or sorting the rest
+        sorted_models = heapq.nlargest(
+            10,
+            (m for m in project.dag.models.values() if m.execution_time is not None),
+            key=lambda m: m.execution_time or 0,
+        )
 
-            # Sort by execution time
-            sorted_models = sorted(
-                models_with_perf,
-                key=lambda m: m.execution_time or 0,
-                reverse=True
-            )[:10]
-
-            lines.append("| Model | Materialization | Execution Time | Rows Affected |")
-            lines.append("|-------|----------------|----------------|---------------|")
+        if sorted_models:
+            write(
+                "## Top Models by Execution Time\n"
+                "\n"
+                "| Model | Materialization | Execution Time | Rows Affected |\n"
+                "|-------|----------------|----------------|---------------|\n"
+            )
 
             for model in sorted_models:
                 exec_time = f"{model.execution_time:.2f}s" if model.execution_time else "N/A"
                 rows = f"{model.rows_affected:,}" if model.rows_affected else "N/A"
-                lines.append(
-                    f"| `{model.name}` | {model.materialization} | {exec_time} | {rows} |"
+                write(
+                    f"| `{model.name}` | {model.materialization} | {exec_time} | {rows} |\n"
                 )
 
-            lines.append("")
+            write("\n")
 
     # Write to file
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text("\n".join(lines))
+    buf.seek(0)
+    with _open_for_write(output_path, buffering=MARKDOWN_WRITE_CHUNK_SIZE) as f:
+        while chunk := buf.read(MARKDOWN_WRITE_CHUNK_SIZE):
+            f.write(chunk.encode())
 
 
 def generate_json_report(
@@ -199,27 +203,73 @@ def generate_json_report(
         recommendations: List of recommendations
         output_path: Path to write the report
     """
-    report: dict[str, Any] = {
-        "metadata": {
-            "timestamp": datetime.now().isoformat(),
-            "project_path": str(project.project_path),
-            "manifest_path": str(project.manifest_path),
-        },
-        "summary": {
-            "total_models": len(project.dag.models) if project.dag else 0,
-            "total_findings": len(findings),
-            "total_recommendations": len(recommendations),
-            "findings_by_severity": {
-                "error": len([f for f in findings if f.severity == Severity.ERROR]),
-                "warn": len([f for f in findings if f.severity == Severity.WARN]),
-                "info": len([f for f in findings if f.severity == Severity.INFO]),
-            },
+    with _open_for_write(output_path, buffering=JSON_WRITE_BUFFER_BYTES) as f:
+        write_json_report(project, findings, recommendations, f)
+
+
+def write_json_report(
+    project: DbtProject,
+    findings: list[Finding],
+    recommendations: list[Recommendation],
+    stream: BinaryIO,
+) -> None:
+    """Stream a JSON report to an open binary file.
+
+    Findings and recommendations are serialized one at a time, so peak memory
+    is bounded by the largest single item rather than the whole report.
+
+    Args:
+        project: The dbt project
+        findings: List of findings
+        recommendations: List of recommendations
+        stream: Binary file object to write the report to
+    """
+    metadata: dict[str, Any] = {
+        "timestamp": datetime.now().isoformat(),
+        "project_path": str(project.project_path),
+        "manifest_path": str(project.manifest_path),
+    }
+    severity_counts = Counter(finding.severity for finding in findings)
+    summary: dict[str, Any] = {
+        "total_models": len(project.dag.models) if project.dag else 0,
+        "total_findings": len(findings),
+        "total_recommendations": len(recommendations),
+        "findings_by_severity": {
+            "error": severity_counts[Severity.ERROR],
+            "warn": severity_counts[Severity.WARN],
+            "info": severity_counts[Severity.INFO],
         },
-        "findings": [finding.model_dump() for finding in findings],
-        "recommendations": [rec.model_dump() for rec in recommendations],
     }
 
-    # Write to file
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(report, f, indent=2)
+    write = stream.write
+    write(b'{\n  "metadata": ')
+    write(_dumps_nested(metadata, depth=1))
+    write(b',\n  "summary": ')
+    write(_dumps_nested(summary, depth=1))
+    write(b',\n  "findings": ')
+    _write_json_array(write, findings)
+    write(b',\n  "recommendations": ')
+    _write_json_array(write, recommendations)
+    write(b"\n}\n")
+
+
+def _dumps_nested(obj: Any, depth: int) -> bytes:
+    """Serialize with two-space indentation, shifted to sit ``depth`` levels deep.
+
+    Encoded strings never contain raw newlines, so every newline in the output
+    is a line break between JSON tokens and can safely take the extra indent.
+    """
+    return dumps(obj, indent=True).replace(b"\n", b"\n" + b"  " * depth)
+
+
+def _write_json_array(
+    write: Callable[[bytes], Any],
+    items: Iterable[Finding | Recommendation],
+) -> None:
+    """Write items as an indented JSON array nested under the top-level object."""
+    empty = True
+    for item in items:
+        write(b"[\n    " if empty else b",\n    ")
+        write(_dumps_nested(item, depth=2))
+        empty = False
+    write(b"[]" if empty else b"\n  ]")
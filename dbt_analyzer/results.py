@@ -1,9 +1,9 @@
 """Run results integration for dbt projects."""
 
-import json
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any
 
+from dbt_analyzer._json import load_json_file
 from dbt_analyzer.models import ProjectDAG
 
 
@@ -23,8 +23,7 @@ def load_run_results(run_results_path: Path) -> dict[str, Any]:
     if not run_results_path.exists():
         raise FileNotFoundError(f"Run results not found at {run_results_path}")
 
-    with open(run_results_path) as f:
-        return json.load(f)
+    return load_json_file(run_results_path)
 
 
 def merge_run_results_into_dag(
@@ -37,22 +36,19 @@ def merge_run_results_into_dag(
         dag: The ProjectDAG to update
         run_results: The run_results dictionary
     """
-    results = run_results.get("results", [])
+    get_model = dag.models.get
 
-    for result in results:
+    for result in run_results.get("results", ()):
         unique_id = result.get("unique_id")
         if not unique_id:
             continue
 
-        model = dag.get_model(unique_id)
+        model = get_model(unique_id)
         if model is None:
             # Result for a model not in our DAG (could be test, snapshot, etc.)
             continue
 
-        # Merge performance data
+        # Merge performance data; rows_affected comes from adapter_response
         model.execution_time = result.get("execution_time")
         model.status = result.get("status")
-
-        # Extract rows_affected from adapter_response
-        adapter_response = result.get("adapter_response", {})
-        model.rows_affected = adapter_response.get("rows_affected")
+        model.rows_affected = (result.get("adapter_response") or {}).get("rows_affected")
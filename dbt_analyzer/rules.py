@@ -1,14 +1,49 @@
 """Analysis rules for dbt projects."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Callable
-
-from dbt_analyzer.models import Finding, MaterializationType, ProjectDAG, Severity
+from functools import partial
+from typing import Callable, ClassVar, Optional
+
+from dbt_analyzer.models import Finding, MaterializationType, Model, ProjectDAG, Severity
+
+# Rationales do not depend on the model, so every finding of a rule shares one string
+_HEAVY_RATIONALE = (
+    "Large or slow-running models benefit from incremental materialization, "
+    "which only processes new or changed records instead of rebuilding the "
+    "entire table on each run. This can significantly reduce compute costs "
+    "and runtime."
+)
+
+_DEAD_RATIONALE = (
+    "Models with no downstream dependents may be: (1) legitimate end-points "
+    "consumed by BI tools or exports, (2) work-in-progress models, or "
+    "(3) truly dead code that should be removed. Review to determine which case applies."
+)
+
+_DEEP_RATIONALE = (
+    "Deep dependency chains make it harder to understand data lineage, "
+    "debug issues, and modify models without breaking downstream dependencies. "
+    "Consider consolidating intermediate transformations or introducing "
+    "strategic materialization points."
+)
+
+_FAN_OUT_RATIONALE = (
+    "Models that are both slow and heavily depended upon create bottlenecks "
+    "in the DAG. Optimizing these models has the highest impact on overall "
+    "pipeline performance and developer productivity."
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RuleConfig:
+    """Configuration for analysis rules.
 
+    Configs are immutable and hashable, so they can key caches of rule results.
+    ``RuleConfig.DEFAULT`` is a shared instance with the default thresholds.
+    """
 
-@dataclass
-class RuleConfig:
-    """Configuration for analysis rules."""
+    DEFAULT: ClassVar["RuleConfig"]
 
     # Thresholds for heavy model detection
     min_execution_time_seconds: float = 60.0
@@ -22,24 +57,30 @@ class RuleConfig:
     include_leaf_models_as_dead: bool = True
 
 
+RuleConfig.DEFAULT = RuleConfig()
+
+
 def check_heavy_non_incremental_models(
     dag: ProjectDAG,
-    config: RuleConfig
+    config: RuleConfig = RuleConfig.DEFAULT,
+    models: Optional[Iterable[Model]] = None,
 ) -> list[Finding]:
     """Identify heavy models that should be incremental.
 
     Args:
         dag: The project DAG
         config: Rule configuration
+        models: Candidate models to check; defaults to every model in the DAG
 
     Returns:
         List of findings for heavy non-incremental models
     """
     findings: list[Finding] = []
+    incremental = MaterializationType.INCREMENTAL
 
-    for model in dag.models.values():
+    for model in dag.models.values() if models is None else models:
         # Skip if already incremental
-        if model.materialization == MaterializationType.INCREMENTAL:
+        if model.materialization == incremental:
             continue
 
         # Skip if we don't have performance data
@@ -74,12 +115,7 @@ def check_heavy_non_incremental_models(
                     f"(execution: {model.execution_time}s, rows: {model.rows_affected}). "
                     f"Consider using incremental materialization."
                 ),
-                rationale=(
-                    "Large or slow-running models benefit from incremental materialization, "
-                    "which only processes new or changed records instead of rebuilding the "
-                    "entire table on each run. This can significantly reduce compute costs "
-                    "and runtime."
-                ),
+                rationale=_HEAVY_RATIONALE,
                 suggested_action=(
                     f"Convert '{model.name}' to incremental materialization. "
                     "Add `config(materialized='incremental', unique_key='your_key')` "
@@ -97,7 +133,10 @@ def check_heavy_non_incremental_models(
     return findings
 
 
-def check_dead_models(dag: ProjectDAG, config: RuleConfig) -> list[Finding]:
+def check_dead_models(
+    dag: ProjectDAG,
+    config: RuleConfig = RuleConfig.DEFAULT
+) -> list[Finding]:
     """Identify unused models with no downstream dependents.
 
     Args:
@@ -110,15 +149,13 @@ def check_dead_models(dag: ProjectDAG, config: RuleConfig) -> list[Finding]:
     findings: list[Finding] = []
 
     for model in dag.models.values():
-        downstream = dag.get_downstream(model.unique_id)
-
-        if len(downstream) == 0:
+        if dag.downstream_count(model.unique_id) == 0:
             # This model has no downstream dependents
             # It might be a legitimate leaf model or truly unused
 
             metadata = {
                 "downstream_count": 0,
-                "upstream_count": len(dag.get_upstream(model.unique_id)),
+                "upstream_count": dag.upstream_count(model.unique_id),
             }
 
             finding = Finding(
@@ -130,11 +167,7 @@ def check_dead_models(dag: ProjectDAG, config: RuleConfig) -> list[Finding]:
                     f"Model '{model.name}' is not referenced by any other models. "
                     f"It may be unused or a legitimate end-point (dashboard, export, etc.)."
                 ),
-                rationale=(
-                    "Models with no downstream dependents may be: (1) legitimate end-points "
-                    "consumed by BI tools or exports, (2) work-in-progress models, or "
-                    "(3) truly dead code that should be removed. Review to determine which case applies."
-                ),
+                rationale=_DEAD_RATIONALE,
                 suggested_action=(
                     f"Review model '{model.name}' to determine if it's still needed. "
                     "If it's consumed externally (BI tool, data export), consider adding "
@@ -149,7 +182,7 @@ def check_dead_models(dag: ProjectDAG, config: RuleConfig) -> list[Finding]:
 
 def check_deep_dependency_chains(
     dag: ProjectDAG,
-    config: RuleConfig
+    config: RuleConfig = RuleConfig.DEFAULT
 ) -> list[Finding]:
     """Identify models with deep dependency chains.
 
@@ -163,18 +196,18 @@ def check_deep_dependency_chains(
     findings: list[Finding] = []
 
     for model in dag.models.values():
-        # Calculate the depth of the deepest upstream chain
-        all_upstream = dag.get_all_upstream(model.unique_id)
-        max_depth = len(all_upstream)
-
-        # Also check longest path from this model
-        longest_downstream = dag.get_longest_path_from(model.unique_id)
+        # Calculate the depth of the deepest upstream chain; the ancestor counts
+        # are precomputed for the whole DAG in one topological pass
+        max_depth = dag.count_all_upstream(model.unique_id)
 
         if max_depth > config.max_dependency_depth:
+            # Only flagged models need the longest path from this model
+            longest_downstream = dag.get_longest_path_from(model.unique_id)
+
             metadata = {
                 "upstream_depth": max_depth,
                 "downstream_depth": longest_downstream,
-                "total_upstream_models": len(all_upstream),
+                "total_upstream_models": max_depth,
             }
 
             finding = Finding(
@@ -187,12 +220,7 @@ def check_deep_dependency_chains(
                     f"exceeding the recommended maximum of {config.max_dependency_depth}. "
                     f"Deep dependency chains can make debugging difficult and increase fragility."
                 ),
-                rationale=(
-                    "Deep dependency chains make it harder to understand data lineage, "
-                    "debug issues, and modify models without breaking downstream dependencies. "
-                    "Consider consolidating intermediate transformations or introducing "
-                    "strategic materialization points."
-                ),
+                rationale=_DEEP_RATIONALE,
                 suggested_action=(
                     f"Review the dependency chain for '{model.name}'. Consider: "
                     "(1) consolidating some intermediate models, "
@@ -208,32 +236,35 @@ def check_deep_dependency_chains(
 
 def check_fan_out_heavy_models(
     dag: ProjectDAG,
-    config: RuleConfig
+    config: RuleConfig = RuleConfig.DEFAULT,
+    models: Optional[Iterable[Model]] = None,
 ) -> list[Finding]:
     """Identify heavy models with many downstream dependents.
 
     Args:
         dag: The project DAG
         config: Rule configuration
+        models: Candidate models to check; defaults to every model in the DAG
 
     Returns:
         List of findings for heavy models with high fan-out
     """
     findings: list[Finding] = []
 
-    for model in dag.models.values():
+    for model in dag.models.values() if models is None else models:
         # Skip if no execution time data
         if model.execution_time is None:
             continue
 
         # Check if model is heavy
-        is_heavy = model.execution_time >= config.min_execution_time_seconds
+        if model.execution_time < config.min_execution_time_seconds:
+            continue
 
-        # Check downstream count
-        downstream = dag.get_downstream(model.unique_id)
-        downstream_count = len(downstream)
+        # Check downstream count; the degree is O(1), the list is only built when flagged
+        downstream_count = dag.downstream_count(model.unique_id)
 
-        if is_heavy and downstream_count >= config.min_downstream_count:
+        if downstream_count >= config.min_downstream_count:
+            downstream = dag.get_downstream(model.unique_id)
             metadata = {
                 "execution_time": model.execution_time,
                 "downstream_count": downstream_count,
@@ -250,11 +281,7 @@ def check_fan_out_heavy_models(
                     f"{downstream_count} downstream dependents. This is a critical bottleneck "
                     f"that affects many downstream models."
                 ),
-                rationale=(
-                    "Models that are both slow and heavily depended upon create bottlenecks "
-                    "in the DAG. Optimizing these models has the highest impact on overall "
-                    "pipeline performance and developer productivity."
-                ),
+                rationale=_FAN_OUT_RATIONALE,
                 suggested_action=(
                     f"Prioritize optimizing '{model.name}'. Consider: "
                     "(1) adding indexes or optimizing SQL, "
@@ -269,7 +296,10 @@ def check_fan_out_heavy_models(
     return findings
 
 
-def run_all_rules(dag: ProjectDAG, config: RuleConfig) -> list[Finding]:
+def run_all_rules(
+    dag: ProjectDAG,
+    config: RuleConfig = RuleConfig.DEFAULT
+) -> list[Finding]:
     """Run all analysis rules on a DAG.
 
     Args:
@@ -281,15 +311,24 @@ def run_all_rules(dag: ProjectDAG, config: RuleConfig) -> list[Finding]:
     """
     all_findings: list[Finding] = []
 
-    rules: list[Callable[[ProjectDAG, RuleConfig], list[Finding]]] = [
-        check_heavy_non_incremental_models,
-        check_dead_models,
-        check_deep_dependency_chains,
-        check_fan_out_heavy_models,
+    # The performance rules only look at models with run_results data, so
+    # filter the candidates once instead of in every rule, and skip those
+    # rules entirely when no model has any performance data
+    perf_models = [
+        m for m in dag.models.values()
+        if m.execution_time is not None or m.rows_affected is not None
     ]
+    timed_models = [m for m in perf_models if m.execution_time is not None]
+
+    rules: list[Callable[[ProjectDAG, RuleConfig], list[Finding]]] = []
+    if perf_models:
+        rules.append(partial(check_heavy_non_incremental_models, models=perf_models))
+    rules.append(check_dead_models)
+    rules.append(check_deep_dependency_chains)
+    if timed_models:
+        rules.append(partial(check_fan_out_heavy_models, models=timed_models))
 
     for rule_func in rules:
-        findings = rule_func(dag, config)
-        all_findings.extend(findings)
+        all_findings.extend(rule_func(dag, config))
 
     return all_findings
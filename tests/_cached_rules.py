@@ -0,0 +1,25 @@
+"""Memoized analysis pipeline for tests that share a loaded project.
+
+Results are cached per (project, config), so tests running the same rules on a
+session-scoped project fixture only evaluate them once. The returned lists are
+shared between tests and must not be modified.
+"""
+
+from functools import lru_cache
+
+from dbt_analyzer.models import Finding, Recommendation
+from dbt_analyzer.project import DbtProject
+from dbt_analyzer.recommendations import generate_recommendations
+from dbt_analyzer.rules import RuleConfig, run_all_rules
+
+
+@lru_cache(maxsize=8)
+def cached_findings(project: DbtProject, config: RuleConfig) -> list[Finding]:
+    """Return the findings of all rules on a loaded project."""
+    return run_all_rules(project.dag, config)
+
+
+@lru_cache(maxsize=8)
+def cached_recommendations(project: DbtProject, config: RuleConfig) -> list[Recommendation]:
+    """Return the recommendations for the cached findings of a loaded project."""
+    return generate_recommendations(cached_findings(project, config))
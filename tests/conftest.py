@@ -1,4 +1,9 @@
-"""Pytest configuration and fixtures."""
+"""Pytest configuration and fixtures.
+
+Fixture files are only read, never modified, so they are parsed once per session.
+The loaded project fixtures are shared the same way; tests that mutate a project
+(such as merging run_results into it) must load their own.
+"""
 
 import json
 from pathlib import Path
@@ -6,48 +11,80 @@ from typing import Any
 
 import pytest
 
+from dbt_analyzer.project import DbtProject
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Return the path to the fixtures directory."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_project_dir(fixtures_dir: Path) -> Path:
     """Return the path to the simple_project fixture."""
     return fixtures_dir / "simple_project"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_manifest(simple_project_dir: Path) -> dict[str, Any]:
     """Load and return the simple_project manifest."""
     with open(simple_project_dir / "manifest.json") as f:
         return json.load(f)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_run_results(simple_project_dir: Path) -> dict[str, Any]:
     """Load and return the simple_project run_results."""
     with open(simple_project_dir / "run_results.json") as f:
         return json.load(f)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def heavy_project_dir(fixtures_dir: Path) -> Path:
     """Return the path to the heavy_non_incremental fixture."""
     return fixtures_dir / "heavy_non_incremental"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def heavy_manifest(heavy_project_dir: Path) -> dict[str, Any]:
     """Load and return the heavy_non_incremental manifest."""
     with open(heavy_project_dir / "manifest.json") as f:
         return json.load(f)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def heavy_run_results(heavy_project_dir: Path) -> dict[str, Any]:
     """Load and return the heavy_non_incremental run_results."""
     with open(heavy_project_dir / "run_results.json") as f:
         return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def loaded_simple_project(simple_project_dir: Path) -> DbtProject:
+    """Return the simple_project loaded without run_results."""
+    project = DbtProject(project_path=simple_project_dir)
+    project.load()
+    return project
+
+
+@pytest.fixture(scope="session")
+def simple_project_with_results(simple_project_dir: Path) -> DbtProject:
+    """Return the simple_project loaded with its run_results."""
+    project = DbtProject(
+        project_path=simple_project_dir,
+        run_results_path=simple_project_dir / "run_results.json"
+    )
+    project.load()
+    return project
+
+
+@pytest.fixture(scope="session")
+def heavy_project_with_results(heavy_project_dir: Path) -> DbtProject:
+    """Return the heavy_non_incremental project loaded with its run_results."""
+    project = DbtProject(
+        project_path=heavy_project_dir,
+        run_results_path=heavy_project_dir / "run_results.json"
+    )
+    project.load()
+    return project
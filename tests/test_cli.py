@@ -1,9 +1,12 @@
 """Tests for CLI."""
 
 from pathlib import Path
+from typing import Any
 
+import pytest
 from typer.testing import CliRunner
 
+from dbt_analyzer import cli
 from dbt_analyzer.cli import _typer_app
 
 runner = CliRunner()
@@ -31,6 +34,31 @@ def test_cli_analyze_basic(simple_project_dir: Path, tmp_path: Path) -> None:
     assert (tmp_path / "analysis_report.json").exists()
 
 
+def test_cli_reports_markdown_before_json_failure(
+    simple_project_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a failing JSON writer doesn't hide the written Markdown report."""
+
+    def fail(**kwargs: Any) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cli, "generate_json_report", fail)
+    result = runner.invoke(
+        _typer_app,
+        [
+            str(simple_project_dir),
+            "--output-path",
+            str(tmp_path),
+            "--format",
+            "both",
+        ],
+    )
+
+    assert isinstance(result.exception, OSError)
+    assert "Markdown report" in result.stdout
+    assert (tmp_path / "analysis_report.md").exists()
+
+
 def test_cli_analyze_markdown_only(simple_project_dir: Path, tmp_path: Path) -> None:
     """Test analyze command with markdown format only."""
     result = runner.invoke(
@@ -1,12 +1,19 @@
 """Tests for project loading and manifest parsing."""
 
+import json
 from pathlib import Path
 from typing import Any
 
 import pytest
 
 from dbt_analyzer.models import MaterializationType, Model, ProjectDAG
-from dbt_analyzer.project import DbtProject, load_manifest, parse_model_from_node
+from dbt_analyzer.project import (
+    DbtProject,
+    load_manifest,
+    parse_model_from_node,
+    read_manifest,
+)
+from dbt_analyzer.rules import RuleConfig, run_all_rules
 
 
 def test_parse_model_from_node(simple_manifest: dict[str, Any]) -> None:
@@ -23,7 +30,6 @@ def test_parse_model_from_node(simple_manifest: dict[str, Any]) -> None:
     assert model.materialization == MaterializationType.VIEW
     assert model.database == "analytics"
     assert model.schema_ == "staging"
-    assert model.compiled_sql == "SELECT * FROM raw.customers"
 
 
 def test_parse_model_with_tags(simple_manifest: dict[str, Any]) -> None:
@@ -38,6 +44,43 @@ def test_parse_model_with_tags(simple_manifest: dict[str, Any]) -> None:
     assert "marts" in model.tags
 
 
+def test_parse_model_with_unknown_materialization() -> None:
+    """Test that unknown materializations default to VIEW."""
+    node = {
+        "name": "custom",
+        "resource_type": "model",
+        "config": {"materialized": "materialized_view"},
+    }
+
+    model = parse_model_from_node("model.my_project.custom", node)
+
+    assert model.materialization == MaterializationType.VIEW
+
+
+def test_model_accepts_schema_alias_and_string_materialization() -> None:
+    """Test constructing a Model with manifest-style keyword values."""
+    model = Model(
+        name="orders",
+        unique_id="model.p.orders",
+        resource_type="model",
+        path="orders.sql",
+        materialization="incremental",
+        schema="marts",
+    )
+
+    assert model.schema_ == "marts"
+    assert model.materialization is MaterializationType.INCREMENTAL
+
+    with pytest.raises(ValueError):
+        Model(
+            name="orders",
+            unique_id="model.p.orders",
+            resource_type="model",
+            path="orders.sql",
+            materialization="materialized_view",
+        )
+
+
 def test_load_manifest(simple_project_dir: Path) -> None:
     """Test loading a complete manifest."""
     manifest = load_manifest(simple_project_dir / "manifest.json")
@@ -47,6 +90,16 @@ def test_load_manifest(simple_project_dir: Path) -> None:
     assert len(manifest["nodes"]) == 4
 
 
+def test_read_manifest_streams_model_nodes(simple_project_dir: Path) -> None:
+    """Test streaming metadata and model nodes from a manifest."""
+    metadata, model_nodes = read_manifest(simple_project_dir / "manifest.json")
+
+    assert metadata["dbt_version"]
+    nodes = dict(model_nodes)
+    assert len(nodes) == 4
+    assert all(node["resource_type"] == "model" for node in nodes.values())
+
+
 def test_dbt_project_initialization(simple_project_dir: Path) -> None:
     """Test initializing a DbtProject."""
     project = DbtProject(project_path=simple_project_dir)
@@ -57,10 +110,9 @@ def test_dbt_project_initialization(simple_project_dir: Path) -> None:
     assert project.dag is None
 
 
-def test_dbt_project_load_manifest(simple_project_dir: Path) -> None:
+def test_dbt_project_load_manifest(loaded_simple_project: DbtProject) -> None:
     """Test loading manifest into DbtProject."""
-    project = DbtProject(project_path=simple_project_dir)
-    project.load()
+    project = loaded_simple_project
 
     assert project.manifest is not None
     assert project.dag is not None
@@ -73,10 +125,9 @@ def test_dbt_project_load_manifest(simple_project_dir: Path) -> None:
     assert stg_customers.materialization == MaterializationType.VIEW
 
 
-def test_dbt_project_build_dag(simple_project_dir: Path) -> None:
+def test_dbt_project_build_dag(loaded_simple_project: DbtProject) -> None:
     """Test that DAG is built correctly with relationships."""
-    project = DbtProject(project_path=simple_project_dir)
-    project.load()
+    project = loaded_simple_project
 
     # Check upstream relationships
     fct_orders = project.dag.get_model("model.my_project.fct_orders")
@@ -95,11 +146,15 @@ def test_dbt_project_build_dag(simple_project_dir: Path) -> None:
     assert len(downstream) == 1
     assert "model.my_project.fct_orders" in downstream
 
+    # Iterator and count variants agree with the list-returning getters
+    assert set(project.dag.get_upstream_iter("model.my_project.fct_orders")) == set(upstream)
+    assert project.dag.upstream_count("model.my_project.fct_orders") == 2
+    assert project.dag.downstream_count("model.my_project.stg_customers") == 1
+
 
-def test_dbt_project_identify_unused_models(simple_project_dir: Path) -> None:
+def test_dbt_project_identify_unused_models(loaded_simple_project: DbtProject) -> None:
     """Test identifying models with no downstream dependents."""
-    project = DbtProject(project_path=simple_project_dir)
-    project.load()
+    project = loaded_simple_project
 
     # unused_model should have no downstream dependents
     unused = project.dag.get_model("model.my_project.unused_model")
@@ -107,12 +162,103 @@ def test_dbt_project_identify_unused_models(simple_project_dir: Path) -> None:
 
     downstream = project.dag.get_downstream("model.my_project.unused_model")
     assert len(downstream) == 0
+    assert project.dag.downstream_count("model.my_project.unused_model") == 0
+    assert list(project.dag.get_downstream_iter("model.my_project.unused_model")) == []
 
     # fct_orders also has no downstream (it's a leaf)
     fct_downstream = project.dag.get_downstream("model.my_project.fct_orders")
     assert len(fct_downstream) == 0
 
 
+def test_dbt_project_get_model_by_name(loaded_simple_project: DbtProject) -> None:
+    """Test looking up models by name."""
+    project = loaded_simple_project
+
+    model = project.get_model_by_name("fct_orders")
+    assert model is not None
+    assert model.unique_id == "model.my_project.fct_orders"
+    assert project.get_model_by_name("does_not_exist") is None
+
+
+def test_dbt_project_ignores_edges_to_unknown_models(tmp_path: Path) -> None:
+    """Test that only edges between loaded models are added to the DAG."""
+    manifest = {
+        "metadata": {"dbt_version": "1.7.0"},
+        "nodes": {
+            "model.p.child": {
+                "name": "child",
+                "resource_type": "model",
+                "config": {"materialized": "view"},
+                "depends_on": {
+                    "nodes": ["model.p.parent", "model.p.disabled", "source.p.raw.t"]
+                },
+            },
+            "model.p.parent": {
+                "name": "parent",
+                "resource_type": "model",
+                "config": {"materialized": "table"},
+                "depends_on": {"nodes": []},
+            },
+        },
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+
+    project = DbtProject(project_path=tmp_path)
+    project.load()
+
+    assert project.dag.get_upstream("model.p.child") == ["model.p.parent"]
+    assert project.dag.get_downstream("model.p.parent") == ["model.p.child"]
+    assert "model.p.disabled" not in project.dag.id_to_idx
+
+
+def test_dbt_project_loads_cyclic_manifest(tmp_path: Path) -> None:
+    """Test that a dependency cycle doesn't break loading or DAG queries."""
+    manifest = {
+        "metadata": {"dbt_version": "1.7.0"},
+        "nodes": {
+            "model.p.a": {
+                "name": "a",
+                "resource_type": "model",
+                "depends_on": {"nodes": ["model.p.b"]},
+            },
+            "model.p.b": {
+                "name": "b",
+                "resource_type": "model",
+                "depends_on": {"nodes": ["model.p.a", "model.p.c"]},
+            },
+            "model.p.c": {
+                "name": "c",
+                "resource_type": "model",
+                "depends_on": {"nodes": []},
+            },
+        },
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+
+    project = DbtProject(project_path=tmp_path)
+    project.load()
+    dag = project.dag
+
+    assert dag.get_all_upstream("model.p.a") == {"model.p.b", "model.p.c"}
+    assert dag.get_all_downstream("model.p.c") == {"model.p.a", "model.p.b"}
+    assert dag.count_all_downstream("model.p.a") == 1
+    # c is outside the cycle, so the a <-> b cycle counts as a single step
+    assert dag.get_longest_path_from("model.p.c") == 1
+    assert dag.get_longest_path_from("model.p.a") == 1
+    assert run_all_rules(dag, RuleConfig.DEFAULT) == []
+
+
+def test_dbt_project_get_model_sql(loaded_simple_project: DbtProject) -> None:
+    """Test reading a model's SQL lazily from the manifest."""
+    project = loaded_simple_project
+
+    compiled_sql, raw_sql = project.get_model_sql("model.my_project.stg_customers")
+    assert compiled_sql == "SELECT * FROM raw.customers"
+    assert raw_sql == "SELECT * FROM {{ source('raw', 'customers') }}"
+
+    assert project.get_model_sql("model.my_project.missing") == (None, None)
+
+
 def test_dbt_project_custom_manifest_path(simple_project_dir: Path) -> None:
     """Test loading with custom manifest path."""
     manifest_path = simple_project_dir / "manifest.json"
@@ -133,3 +279,78 @@ def test_dbt_project_missing_manifest() -> None:
 
     with pytest.raises(FileNotFoundError):
         project.load()
+
+
+def test_load_manifest_memory_mapped(
+    simple_project_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that large manifests parse identically through the mmap path."""
+    import dbt_analyzer._json as json_helpers
+
+    expected = load_manifest(simple_project_dir / "manifest.json")
+    monkeypatch.setattr(json_helpers, "MMAP_THRESHOLD_BYTES", 0)
+
+    assert load_manifest(simple_project_dir / "manifest.json") == expected
+
+
+def _make_model(unique_id: str) -> Model:
+    return Model(
+        name=unique_id.split(".")[-1],
+        unique_id=unique_id,
+        resource_type="model",
+        path=f"{unique_id}.sql",
+        materialization=MaterializationType.VIEW,
+    )
+
+
+def test_project_dag_traversal_on_diamond() -> None:
+    """Test transitive and path queries on a diamond with a shortcut edge."""
+    dag = ProjectDAG()
+    for name in ("a", "b", "c", "d"):
+        dag.add_model(_make_model(f"model.p.{name}"))
+    dag.add_dependency("model.p.a", "model.p.b")
+    dag.add_dependency("model.p.a", "model.p.c")
+    dag.add_dependency("model.p.b", "model.p.d")
+    dag.add_dependency("model.p.c", "model.p.d")
+
+    assert dag.get_all_upstream("model.p.d") == {"model.p.a", "model.p.b", "model.p.c"}
+    assert dag.get_all_downstream("model.p.b") == {"model.p.d"}
+    assert dag.count_all_upstream("model.p.d") == 3
+    assert dag.count_all_downstream("model.p.a") == 3
+    assert dag.get_longest_path_from("model.p.a") == 2
+
+    # Edges added after a query are picked up, including shortcuts
+    dag.add_dependency("model.p.a", "model.p.d")
+    assert dag.get_path_length("model.p.a", "model.p.d") == 1
+    assert dag.get_longest_path_from("model.p.a") == 2
+    assert dag.get_path_length("model.p.d", "model.p.a") is None
+    assert sorted(dag.get_downstream("model.p.a")) == [
+        "model.p.b",
+        "model.p.c",
+        "model.p.d",
+    ]
+
+
+def test_project_dag_cycle_leaves_acyclic_subgraph_unchanged() -> None:
+    """Test that a cycle only changes the metrics of the models inside it."""
+    dag = ProjectDAG()
+    for name in ("a", "b", "c", "d", "x", "y", "z"):
+        dag.add_model(_make_model(f"model.p.{name}"))
+    dag.add_dependency("model.p.a", "model.p.b")
+    dag.add_dependency("model.p.b", "model.p.c")
+    dag.add_dependency("model.p.c", "model.p.d")
+    dag.add_dependency("model.p.a", "model.p.d")
+    assert dag.get_longest_path_from("model.p.a") == 3
+
+    # An unrelated x <-> y cycle, fed by z
+    dag.add_dependency("model.p.x", "model.p.y")
+    dag.add_dependency("model.p.y", "model.p.x")
+    dag.add_dependency("model.p.z", "model.p.x")
+
+    assert dag.get_longest_path_from("model.p.a") == 3
+    assert dag.get_longest_path_from("model.p.b") == 2
+    assert dag.get_all_upstream("model.p.d") == {"model.p.a", "model.p.b", "model.p.c"}
+    assert dag.get_longest_path_from("model.p.z") == 1
+    assert dag.get_longest_path_from("model.p.x") == 1
+    assert dag.get_all_downstream("model.p.z") == {"model.p.x", "model.p.y"}
+    assert dag.get_all_upstream("model.p.x") == {"model.p.y", "model.p.z"}
@@ -1,23 +1,19 @@
 """Tests for recommendations layer."""
 
-from pathlib import Path
+from _cached_rules import cached_findings
 
 from dbt_analyzer.models import Finding, Severity
 from dbt_analyzer.project import DbtProject
 from dbt_analyzer.recommendations import generate_recommendations
-from dbt_analyzer.rules import RuleConfig, run_all_rules
+from dbt_analyzer.rules import RuleConfig
 
 
-def test_generate_recommendations_from_findings(heavy_project_dir: Path) -> None:
+def test_generate_recommendations_from_findings(heavy_project_with_results: DbtProject) -> None:
     """Test generating recommendations from findings."""
-    project = DbtProject(
-        project_path=heavy_project_dir,
-        run_results_path=heavy_project_dir / "run_results.json"
-    )
-    project.load()
+    project = heavy_project_with_results
 
-    config = RuleConfig()
-    findings = run_all_rules(project.dag, config)
+    config = RuleConfig.DEFAULT
+    findings = cached_findings(project, config)
 
     recommendations = generate_recommendations(findings)
 
@@ -34,16 +30,12 @@ def test_generate_recommendations_from_findings(heavy_project_dir: Path) -> None
         assert rec.priority >= 1
 
 
-def test_recommendations_include_code_snippets(heavy_project_dir: Path) -> None:
+def test_recommendations_include_code_snippets(heavy_project_with_results: DbtProject) -> None:
     """Test that recommendations include code snippets for incremental models."""
-    project = DbtProject(
-        project_path=heavy_project_dir,
-        run_results_path=heavy_project_dir / "run_results.json"
-    )
-    project.load()
+    project = heavy_project_with_results
 
-    config = RuleConfig()
-    findings = run_all_rules(project.dag, config)
+    config = RuleConfig.DEFAULT
+    findings = cached_findings(project, config)
 
     recommendations = generate_recommendations(findings)
 
@@ -63,16 +55,12 @@ def test_recommendations_include_code_snippets(heavy_project_dir: Path) -> None:
         assert "config" in snippet_text.lower() or "incremental" in snippet_text.lower()
 
 
-def test_recommendations_prioritization(simple_project_dir: Path) -> None:
+def test_recommendations_prioritization(simple_project_with_results: DbtProject) -> None:
     """Test that recommendations are prioritized correctly."""
-    project = DbtProject(
-        project_path=simple_project_dir,
-        run_results_path=simple_project_dir / "run_results.json"
-    )
-    project.load()
+    project = simple_project_with_results
 
     config = RuleConfig(min_execution_time_seconds=1.0)
-    findings = run_all_rules(project.dag, config)
+    findings = cached_findings(project, config)
 
     recommendations = generate_recommendations(findings)
 
@@ -81,16 +69,12 @@ def test_recommendations_prioritization(simple_project_dir: Path) -> None:
     assert priorities == sorted(priorities, reverse=True)
 
 
-def test_recommendations_group_related_findings(heavy_project_dir: Path) -> None:
+def test_recommendations_group_related_findings(heavy_project_with_results: DbtProject) -> None:
     """Test that recommendations group related findings together."""
-    project = DbtProject(
-        project_path=heavy_project_dir,
-        run_results_path=heavy_project_dir / "run_results.json"
-    )
-    project.load()
-
-    config = RuleConfig()
-    findings = run_all_rules(project.dag, config)
+    project = heavy_project_with_results
+
+    config = RuleConfig.DEFAULT
+    findings = cached_findings(project, config)
 
     recommendations = generate_recommendations(findings)
 
@@ -1,25 +1,28 @@
 """Tests for report generation."""
 
+import io
 import json
 from pathlib import Path
 
+from _cached_rules import cached_findings, cached_recommendations
+
+from dbt_analyzer.models import Finding, Severity
 from dbt_analyzer.project import DbtProject
-from dbt_analyzer.recommendations import generate_recommendations
-from dbt_analyzer.report import generate_json_report, generate_markdown_report
-from dbt_analyzer.rules import RuleConfig, run_all_rules
+from dbt_analyzer.report import (
+    generate_json_report,
+    generate_markdown_report,
+    write_json_report,
+)
+from dbt_analyzer.rules import RuleConfig
 
 
-def test_generate_markdown_report(heavy_project_dir: Path, tmp_path: Path) -> None:
+def test_generate_markdown_report(heavy_project_with_results: DbtProject, tmp_path: Path) -> None:
     """Test generating a Markdown report."""
-    project = DbtProject(
-        project_path=heavy_project_dir,
-        run_results_path=heavy_project_dir / "run_results.json"
-    )
-    project.load()
+    project = heavy_project_with_results
 
-    config = RuleConfig()
-    findings = run_all_rules(project.dag, config)
-    recommendations = generate_recommendations(findings)
+    config = RuleConfig.DEFAULT
+    findings = cached_findings(project, config)
+    recommendations = cached_recommendations(project, config)
 
     report_path = tmp_path / "report.md"
     generate_markdown_report(
@@ -46,17 +49,13 @@ def test_generate_markdown_report(heavy_project_dir: Path, tmp_path: Path) -> No
     assert "Incremental" in content or "incremental" in content
 
 
-def test_generate_json_report(heavy_project_dir: Path, tmp_path: Path) -> None:
+def test_generate_json_report(heavy_project_with_results: DbtProject, tmp_path: Path) -> None:
     """Test generating a JSON report."""
-    project = DbtProject(
-        project_path=heavy_project_dir,
-        run_results_path=heavy_project_dir / "run_results.json"
-    )
-    project.load()
+    project = heavy_project_with_results
 
-    config = RuleConfig()
-    findings = run_all_rules(project.dag, config)
-    recommendations = generate_recommendations(findings)
+    config = RuleConfig.DEFAULT
+    findings = cached_findings(project, config)
+    recommendations = cached_recommendations(project, config)
 
     report_path = tmp_path / "report.json"
     generate_json_report(
@@ -94,17 +93,15 @@ def test_generate_json_report(heavy_project_dir: Path, tmp_path: Path) -> None:
     assert "model_name" in first_finding
 
 
-def test_markdown_report_includes_model_stats(simple_project_dir: Path, tmp_path: Path) -> None:
+def test_markdown_report_includes_model_stats(
+    simple_project_with_results: DbtProject, tmp_path: Path
+) -> None:
     """Test that Markdown report includes model performance stats."""
-    project = DbtProject(
-        project_path=simple_project_dir,
-        run_results_path=simple_project_dir / "run_results.json"
-    )
-    project.load()
+    project = simple_project_with_results
 
-    config = RuleConfig()
-    findings = run_all_rules(project.dag, config)
-    recommendations = generate_recommendations(findings)
+    config = RuleConfig.DEFAULT
+    findings = cached_findings(project, config)
+    recommendations = cached_recommendations(project, config)
 
     report_path = tmp_path / "report.md"
     generate_markdown_report(
@@ -123,17 +120,13 @@ def test_markdown_report_includes_model_stats(simple_project_dir: Path, tmp_path
     assert "stg_customers" in content or "fct_orders" in content
 
 
-def test_json_report_structure(simple_project_dir: Path, tmp_path: Path) -> None:
+def test_json_report_structure(simple_project_with_results: DbtProject, tmp_path: Path) -> None:
     """Test that JSON report has correct structure."""
-    project = DbtProject(
-        project_path=simple_project_dir,
-        run_results_path=simple_project_dir / "run_results.json"
-    )
-    project.load()
+    project = simple_project_with_results
 
-    config = RuleConfig()
-    findings = run_all_rules(project.dag, config)
-    recommendations = generate_recommendations(findings)
+    config = RuleConfig.DEFAULT
+    findings = cached_findings(project, config)
+    recommendations = cached_recommendations(project, config)
 
     report_path = tmp_path / "report.json"
     generate_json_report(
@@ -163,18 +156,17 @@ def test_json_report_structure(simple_project_dir: Path, tmp_path: Path) -> None
         assert "suggested_action" in finding
 
 
-def test_reports_with_no_findings(simple_project_dir: Path, tmp_path: Path) -> None:
+def test_reports_with_no_findings(loaded_simple_project: DbtProject, tmp_path: Path) -> None:
     """Test generating reports when there are no findings."""
-    project = DbtProject(project_path=simple_project_dir)
-    project.load()
+    project = loaded_simple_project
 
     # Use very high thresholds so no findings are generated
     config = RuleConfig(
         min_execution_time_seconds=10000.0,
         max_dependency_depth=1000
     )
-    findings = run_all_rules(project.dag, config)
-    recommendations = generate_recommendations(findings)
+    findings = cached_findings(project, config)
+    recommendations = cached_recommendations(project, config)
 
     # Generate both reports
     md_path = tmp_path / "empty_report.md"
@@ -209,3 +201,60 @@ def test_reports_with_no_findings(simple_project_dir: Path, tmp_path: Path) -> N
     # Just verify the structure is valid
     assert "findings" in data
     assert "recommendations" in data
+
+
+def test_write_json_report_streams_to_file_object(heavy_project_with_results: DbtProject) -> None:
+    """Test streaming a JSON report to an open binary file."""
+    project = heavy_project_with_results
+
+    findings = cached_findings(project, RuleConfig.DEFAULT)
+    recommendations = cached_recommendations(project, RuleConfig.DEFAULT)
+
+    buffer = io.BytesIO()
+    write_json_report(project, findings, recommendations, buffer)
+
+    data = json.loads(buffer.getvalue())
+    assert data["summary"]["total_findings"] == len(findings)
+    assert [f["model_name"] for f in data["findings"]] == [f.model_name for f in findings]
+    assert len(data["recommendations"]) == len(recommendations)
+
+
+def test_write_json_report_encoding(loaded_simple_project: DbtProject) -> None:
+    """Test that the JSON report is indented UTF-8 with non-ASCII text unescaped."""
+    finding = Finding(
+        id="DEAD_MODEL",
+        severity=Severity.INFO,
+        model_name="ventes_général",
+        title="Modèle 'ventes_général' sans dépendants",
+        description="—",
+        rationale="",
+        suggested_action="",
+    )
+
+    buffer = io.BytesIO()
+    write_json_report(loaded_simple_project, [finding], [], buffer)
+    raw = buffer.getvalue()
+
+    assert "ventes_général".encode() in raw
+    assert b"\\u00e9" not in raw
+    # Same layout as json.dumps(indent=2), but UTF-8 and newline-terminated
+    expected = json.dumps(json.loads(raw), indent=2, ensure_ascii=False) + "\n"
+    assert raw.decode("utf-8") == expected
+
+
+def test_reports_create_missing_output_directory(
+    loaded_simple_project: DbtProject, tmp_path: Path
+) -> None:
+    """Test that reports create their output directory when it doesn't exist."""
+    project = loaded_simple_project
+
+    findings = cached_findings(project, RuleConfig.DEFAULT)
+    recommendations = cached_recommendations(project, RuleConfig.DEFAULT)
+
+    md_path = tmp_path / "nested" / "reports" / "report.md"
+    json_path = tmp_path / "other" / "report.json"
+    generate_markdown_report(project, findings, recommendations, md_path)
+    generate_json_report(project, findings, recommendations, json_path)
+
+    assert md_path.read_text(encoding="utf-8").startswith("# dbt Pipeline Analysis Report")
+    assert json.loads(json_path.read_bytes())["summary"]["total_models"] == len(project.dag.models)
@@ -99,13 +99,9 @@ def test_merge_run_results_partial_data(simple_project_dir: Path) -> None:
     assert stg_orders.rows_affected is None
 
 
-def test_dbt_project_load_with_run_results(simple_project_dir: Path) -> None:
+def test_dbt_project_load_with_run_results(simple_project_with_results: DbtProject) -> None:
     """Test loading project with run_results via DbtProject."""
-    project = DbtProject(
-        project_path=simple_project_dir,
-        run_results_path=simple_project_dir / "run_results.json"
-    )
-    project.load()
+    project = simple_project_with_results
 
     # Verify performance data was loaded
     fct_orders = project.dag.get_model("model.my_project.fct_orders")
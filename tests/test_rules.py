@@ -1,8 +1,10 @@
 """Tests for analysis rules."""
 
-from pathlib import Path
+from dataclasses import FrozenInstanceError
 
-from dbt_analyzer.models import Severity
+import pytest
+
+from dbt_analyzer.models import MaterializationType, Model, ProjectDAG, Severity
 from dbt_analyzer.project import DbtProject
 from dbt_analyzer.rules import (
     RuleConfig,
@@ -14,13 +16,18 @@ from dbt_analyzer.rules import (
 )
 
 
-def test_check_heavy_non_incremental_models(heavy_project_dir: Path) -> None:
+def test_rule_config_default_is_frozen() -> None:
+    """Test that the shared default config matches a fresh one and can't be mutated."""
+    assert RuleConfig.DEFAULT == RuleConfig()
+    assert hash(RuleConfig.DEFAULT) == hash(RuleConfig())
+
+    with pytest.raises(FrozenInstanceError):
+        RuleConfig.DEFAULT.max_dependency_depth = 1  # type: ignore[misc]
+
+
+def test_check_heavy_non_incremental_models(heavy_project_with_results: DbtProject) -> None:
     """Test identifying heavy models that should be incremental."""
-    project = DbtProject(
-        project_path=heavy_project_dir,
-        run_results_path=heavy_project_dir / "run_results.json"
-    )
-    project.load()
+    project = heavy_project_with_results
 
     config = RuleConfig(
         min_execution_time_seconds=60.0,
@@ -45,13 +52,11 @@ def test_check_heavy_non_incremental_models(heavy_project_dir: Path) -> None:
         assert finding.proposed_changes.get("materialization") == "incremental"
 
 
-def test_check_heavy_non_incremental_with_thresholds(heavy_project_dir: Path) -> None:
+def test_check_heavy_non_incremental_with_thresholds(
+    heavy_project_with_results: DbtProject
+) -> None:
     """Test that thresholds are respected."""
-    project = DbtProject(
-        project_path=heavy_project_dir,
-        run_results_path=heavy_project_dir / "run_results.json"
-    )
-    project.load()
+    project = heavy_project_with_results
 
     # Set very high thresholds - should find nothing
     config = RuleConfig(
@@ -63,12 +68,23 @@ def test_check_heavy_non_incremental_with_thresholds(heavy_project_dir: Path) ->
     assert len(findings) == 0
 
 
-def test_check_dead_models(simple_project_dir: Path) -> None:
+def test_rules_only_check_given_candidate_models(heavy_project_with_results: DbtProject) -> None:
+    """Test that rules restricted to candidate models ignore the rest."""
+    project = heavy_project_with_results
+    config = RuleConfig.DEFAULT
+
+    slow_view = project.get_model_by_name("slow_view_model")
+    findings = check_heavy_non_incremental_models(project.dag, config, models=[slow_view])
+    assert [f.model_name for f in findings] == ["slow_view_model"]
+
+    assert check_fan_out_heavy_models(project.dag, config, models=[]) == []
+
+
+def test_check_dead_models(loaded_simple_project: DbtProject) -> None:
     """Test identifying unused models with no downstream dependents."""
-    project = DbtProject(project_path=simple_project_dir)
-    project.load()
+    project = loaded_simple_project
 
-    config = RuleConfig()
+    config = RuleConfig.DEFAULT
     findings = check_dead_models(project.dag, config)
 
     # Should find unused_model and fct_orders (both have no downstream)
@@ -85,10 +101,9 @@ def test_check_dead_models(simple_project_dir: Path) -> None:
     assert "not referenced" in unused_finding.description.lower()
 
 
-def test_check_deep_dependency_chains(simple_project_dir: Path) -> None:
+def test_check_deep_dependency_chains(loaded_simple_project: DbtProject) -> None:
     """Test identifying deep dependency chains."""
-    project = DbtProject(project_path=simple_project_dir)
-    project.load()
+    project = loaded_simple_project
 
     # Set max_depth to 2, which should flag fct_orders (depends on staging models)
     config = RuleConfig(max_dependency_depth=2)
@@ -108,13 +123,9 @@ def test_check_deep_dependency_chains(simple_project_dir: Path) -> None:
         assert finding.severity == Severity.WARN
 
 
-def test_check_fan_out_heavy_models(simple_project_dir: Path) -> None:
+def test_check_fan_out_heavy_models(simple_project_with_results: DbtProject) -> None:
     """Test identifying heavy models with many downstream dependents."""
-    project = DbtProject(
-        project_path=simple_project_dir,
-        run_results_path=simple_project_dir / "run_results.json"
-    )
-    project.load()
+    project = simple_project_with_results
 
     # fct_orders is slow (125.7s) but has no downstream dependents
     # stg_orders/stg_customers have 1 downstream each
@@ -136,15 +147,11 @@ def test_check_fan_out_heavy_models(simple_project_dir: Path) -> None:
         assert finding.severity == Severity.ERROR
 
 
-def test_run_all_rules(heavy_project_dir: Path) -> None:
+def test_run_all_rules(heavy_project_with_results: DbtProject) -> None:
     """Test running all rules together."""
-    project = DbtProject(
-        project_path=heavy_project_dir,
-        run_results_path=heavy_project_dir / "run_results.json"
-    )
-    project.load()
+    project = heavy_project_with_results
 
-    config = RuleConfig()
+    config = RuleConfig.DEFAULT
     all_findings = run_all_rules(project.dag, config)
 
     # Should have findings from multiple rule types
@@ -155,12 +162,44 @@ def test_run_all_rules(heavy_project_dir: Path) -> None:
     assert "HEAVY_NON_INCREMENTAL_MODEL" in finding_types
 
 
-def test_rules_with_no_run_results(simple_project_dir: Path) -> None:
+def test_run_all_rules_on_hand_built_dag() -> None:
+    """Test that performance rules see metrics set directly on models."""
+    dag = ProjectDAG()
+    for name in "abcde":
+        dag.add_model(
+            Model(
+                name=name,
+                unique_id=f"model.p.{name}",
+                resource_type="model",
+                path=f"{name}.sql",
+                materialization=(
+                    MaterializationType.INCREMENTAL if name == "a" else MaterializationType.TABLE
+                ),
+                execution_time=120.0,
+                rows_affected=1_000_000,
+            )
+        )
+    for child in "bcde":
+        dag.add_dependency("model.p.a", f"model.p.{child}")
+
+    findings = run_all_rules(dag, RuleConfig.DEFAULT)
+
+    heavy = sorted(f.model_name for f in findings if f.id == "HEAVY_NON_INCREMENTAL_MODEL")
+    fan_out = [f.model_name for f in findings if f.id == "FAN_OUT_HEAVY_MODEL"]
+    assert heavy == ["b", "c", "d", "e"]
+    assert fan_out == ["a"]
+
+    # Materializations given as plain strings are compared by value
+    dag.models["model.p.a"].materialization = "incremental"  # type: ignore[assignment]
+    findings = check_heavy_non_incremental_models(dag, RuleConfig.DEFAULT)
+    assert sorted(f.model_name for f in findings) == ["b", "c", "d", "e"]
+
+
+def test_rules_with_no_run_results(loaded_simple_project: DbtProject) -> None:
     """Test that rules handle missing run_results gracefully."""
-    project = DbtProject(project_path=simple_project_dir)
-    project.load()
+    project = loaded_simple_project
 
-    config = RuleConfig()
+    config = RuleConfig.DEFAULT
 
     # Rules that depend on execution time should return empty findings
     findings = check_heavy_non_incremental_models(project.dag, config)